@@ -16,6 +16,20 @@ import keyword
 from .pyrtlexceptions import PyrtlError, PyrtlInternalError
 
 
+# the wire and memory modules import core, so the classes the per-wire and
+# per-net sanity checks dispatch on are bound lazily on first use rather than
+# re-imported inside every check
+_WireVector = _Input = _Output = _Const = _Register = _MemBlock = None
+
+
+def _resolve_checked_types():
+    global _WireVector, _Input, _Output, _Const, _Register, _MemBlock
+    from .wire import WireVector, Input, Output, Const, Register
+    from .memory import MemBlock
+    _WireVector, _Input, _Output, _Const, _Register, _MemBlock = (
+        WireVector, Input, Output, Const, Register, MemBlock)
+
+
 # -----------------------------------------------------------------
 #    __        __   __
 #   |__) |    /  \ /  ` |__/
@@ -262,6 +276,9 @@ class Block(object):
         self.legal_ops = set('w~&|^n+-*<>=xcsrm@')  # set of legal OPS
         self.rtl_assert_dict = {}   # map from wirevectors -> exceptions, used by rtl_assert
         self.memblock_by_name = {}  # map from name->memblock, for easy access to memblock objs
+        # map from (type, value, bitwidth) -> Const, filled in by corecircuits.as_wires
+        # so that repeated conversions of the same literal share one Const wire
+        self._const_cache = collections.OrderedDict()
 
     def __str__(self):
         """String form has one LogicNet per line."""
@@ -645,121 +662,131 @@ class Block(object):
 
     def sanity_check_wirevector(self, w):
         """ Check that w is a valid wirevector type. """
-        from .wire import WireVector
-        if not isinstance(w, WireVector):
+        if _WireVector is None:
+            _resolve_checked_types()
+        if not isinstance(w, _WireVector):
             raise PyrtlError(
                 'error attempting to pass an input of type "%s" '
                 'instead of WireVector' % type(w))
 
     def sanity_check_memblock(self, m):
         """ Check that m is a valid memblock type. """
-        from .memory import MemBlock
-        if not isinstance(m, MemBlock):
+        if _MemBlock is None:
+            _resolve_checked_types()
+        if not isinstance(m, _MemBlock):
             raise PyrtlError(
                 'error attempting to pass an input of type "%s" '
                 'instead of MemBlock' % type(m))
 
     def sanity_check_net(self, net):
         """ Check that net is a valid LogicNet. """
-        from .wire import Input, Output, Const, Register
-        from .memory import MemBlock
+        if _WireVector is None:
+            _resolve_checked_types()
+        Input, Output, Const, Register, MemBlock = _Input, _Output, _Const, _Register, _MemBlock
 
         # general sanity checks that apply to all operations
         if not isinstance(net, LogicNet):
             raise PyrtlInternalError('error, net must be of type LogicNet')
-        if not isinstance(net.args, tuple):
+
+        # the net fields are namedtuple properties, so pull them into locals
+        # once rather than re-dispatching on every one of the several dozen
+        # reads below
+        op, op_param, args, dests = net.op, net.op_param, net.args, net.dests
+
+        if not isinstance(args, tuple):
             raise PyrtlInternalError('error, LogicNet args must be tuple')
-        if not isinstance(net.dests, tuple):
+        if not isinstance(dests, tuple):
             raise PyrtlInternalError('error, LogicNet dests must be tuple')
-        for w in net.args + net.dests:
+        for w in args + dests:
             self.sanity_check_wirevector(w)
             if w._block is not self:
                 raise PyrtlInternalError('error, net references different block')
             if w not in self.wirevector_set:
                 raise PyrtlInternalError('error, net with unknown source "%s"' % w.name)
 
-        # checks that input and output wirevectors are not misused
-        bad_dests = set(filter(lambda w: isinstance(w, (Input, Const)), net.dests))
-        if bad_dests:
-            raise PyrtlInternalError('error, Inputs, Consts cannot be destinations to a net (%s)' %
-                                     ','.join(map(str, bad_dests)))
-        bad_args = set(filter(lambda w: isinstance(w, (Output)), net.args))
-        if bad_args:
-            raise PyrtlInternalError('error, Outputs cannot be arguments for a net (%s)' %
-                                     ','.join(map(str, bad_args)))
-
-        if net.op not in self.legal_ops:
+        # checks that input and output wirevectors are not misused; this runs
+        # once per net created so scan and bail early rather than building sets
+        for w in dests:
+            if isinstance(w, (Input, Const)):
+                raise PyrtlInternalError(
+                    'error, Inputs, Consts cannot be destinations to a net (%s)' % str(w))
+        for w in args:
+            if isinstance(w, Output):
+                raise PyrtlInternalError(
+                    'error, Outputs cannot be arguments for a net (%s)' % str(w))
+
+        if op not in self.legal_ops:
             raise PyrtlInternalError('error, net op "%s" not from acceptable set %s' %
-                                     (net.op, self.legal_ops))
+                                     (op, self.legal_ops))
 
         # operation-specific checks on arguments
-        if net.op in 'w~rsm' and len(net.args) != 1:
+        if op in 'w~rsm' and len(args) != 1:
             raise PyrtlInternalError('error, op only allowed 1 argument')
-        if net.op in '&|^n+-*<>=' and len(net.args) != 2:
+        if op in '&|^n+-*<>=' and len(args) != 2:
             raise PyrtlInternalError('error, op only allowed 2 arguments')
-        if net.op == 'x':
-            if len(net.args) != 3:
+        if op == 'x':
+            if len(args) != 3:
                 raise PyrtlInternalError('error, op only allowed 3 arguments')
-            if net.args[1].bitwidth != net.args[2].bitwidth:
+            if args[1].bitwidth != args[2].bitwidth:
                 raise PyrtlInternalError('error, args have mismatched bitwidths')
-            if net.args[0].bitwidth != 1:
+            if args[0].bitwidth != 1:
                 raise PyrtlInternalError('error, mux select must be a single bit')
-        if net.op == '@' and len(net.args) != 3:
+        if op == '@' and len(args) != 3:
             raise PyrtlInternalError('error, op only allowed 3 arguments')
-        if net.op in '&|^n+-*<>=' and net.args[0].bitwidth != net.args[1].bitwidth:
+        if op in '&|^n+-*<>=' and args[0].bitwidth != args[1].bitwidth:
             raise PyrtlInternalError('error, args have mismatched bitwidths')
-        if net.op in 'm@' and net.args[0].bitwidth != net.op_param[1].addrwidth:
+        if op in 'm@' and args[0].bitwidth != op_param[1].addrwidth:
             raise PyrtlInternalError('error, mem addrwidth mismatch')
-        if net.op == '@' and net.args[1].bitwidth != net.op_param[1].bitwidth:
+        if op == '@' and args[1].bitwidth != op_param[1].bitwidth:
             raise PyrtlInternalError('error, mem bitwidth mismatch')
-        if net.op == '@' and net.args[2].bitwidth != 1:
+        if op == '@' and args[2].bitwidth != 1:
             raise PyrtlInternalError('error, mem write enable must be 1 bit')
 
         # operation-specific checks on op_params
-        if net.op in 'w~&|^n+-*<>=xcr' and net.op_param is not None:
+        if op in 'w~&|^n+-*<>=xcr' and op_param is not None:
             raise PyrtlInternalError('error, op_param should be None')
-        if net.op == 's':
-            if not isinstance(net.op_param, tuple):
+        if op == 's':
+            if not isinstance(op_param, tuple):
                 raise PyrtlInternalError('error, select op requires tuple op_param')
-            for p in net.op_param:
+            for p in op_param:
                 if not isinstance(p, int):
                     raise PyrtlInternalError('error, select op_param requires ints')
-                if p < 0 or p >= net.args[0].bitwidth:
+                if p < 0 or p >= args[0].bitwidth:
                     raise PyrtlInternalError('error, op_param out of bounds')
-        if net.op in 'm@':
-            if not isinstance(net.op_param, tuple):
+        if op in 'm@':
+            if not isinstance(op_param, tuple):
                 raise PyrtlInternalError('error, mem op requires tuple op_param')
-            if len(net.op_param) != 2:
+            if len(op_param) != 2:
                 raise PyrtlInternalError('error, mem op requires 2 op_params in tuple')
-            if not isinstance(net.op_param[0], int):
+            if not isinstance(op_param[0], int):
                 raise PyrtlInternalError('error, mem op requires first operand as int')
-            if not isinstance(net.op_param[1], MemBlock):
+            if not isinstance(op_param[1], MemBlock):
                 raise PyrtlInternalError('error, mem op requires second operand of a memory type')
 
         # operation-specific checks on destinations
-        if net.op in 'w~&|^n+-*<>=xcsrm' and len(net.dests) != 1:
+        if op in 'w~&|^n+-*<>=xcsrm' and len(dests) != 1:
             raise PyrtlInternalError('error, op only allowed 1 destination')
-        if net.op == '@' and net.dests != ():
+        if op == '@' and dests != ():
             raise PyrtlInternalError('error, mem write dest should be empty tuple')
-        if net.op == 'r' and not isinstance(net.dests[0], Register):
+        if op == 'r' and not isinstance(dests[0], Register):
             raise PyrtlInternalError('error, dest of next op should be a Register')
 
         # check destination validity
-        if net.op in 'w~&|^nr' and net.dests[0].bitwidth > net.args[0].bitwidth:
+        if op in 'w~&|^nr' and dests[0].bitwidth > args[0].bitwidth:
             raise PyrtlInternalError('error, upper bits of destination unassigned')
-        if net.op in '<>=' and net.dests[0].bitwidth != 1:
+        if op in '<>=' and dests[0].bitwidth != 1:
             raise PyrtlInternalError('error, destination should be of bitwidth=1')
-        if net.op in '+-' and net.dests[0].bitwidth > net.args[0].bitwidth + 1:
+        if op in '+-' and dests[0].bitwidth > args[0].bitwidth + 1:
             raise PyrtlInternalError('error, upper bits of destination unassigned')
-        if net.op == '*' and net.dests[0].bitwidth > 2 * net.args[0].bitwidth:
+        if op == '*' and dests[0].bitwidth > 2 * args[0].bitwidth:
             raise PyrtlInternalError('error, upper bits of destination unassigned')
-        if net.op == 'x' and net.dests[0].bitwidth > net.args[1].bitwidth:
+        if op == 'x' and dests[0].bitwidth > args[1].bitwidth:
             raise PyrtlInternalError('error, upper bits of mux output undefined')
-        if net.op == 'c' and net.dests[0].bitwidth > sum(x.bitwidth for x in net.args):
+        if op == 'c' and dests[0].bitwidth > sum(x.bitwidth for x in args):
             raise PyrtlInternalError('error, upper bits of concat output undefined')
-        if net.op == 's' and net.dests[0].bitwidth > len(net.op_param):
+        if op == 's' and dests[0].bitwidth > len(op_param):
             raise PyrtlInternalError('error, upper bits of select output undefined')
-        if net.op == 'm' and net.dests[0].bitwidth != net.op_param[1].bitwidth:
+        if op == 'm' and dests[0].bitwidth != op_param[1].bitwidth:
             raise PyrtlInternalError('error, mem read dest bitwidth mismatch')
 
 
@@ -808,6 +835,11 @@ def _get_debug_mode():
     return debug_mode
 
 
+# map from (code object, instruction offset) -> (filename, lineno), so that
+# repeated calls from the same user callsite skip the frame inspection below
+_callpoint_cache = {}
+
+
 def _get_useful_callpoint_name():
     """ Attempts to find the lowest user-level call into the PyRTL module.
 
@@ -823,23 +855,29 @@ def _get_useful_callpoint_name():
     if not _setting_slower_but_more_descriptive_tmps:
         return None
 
-    import inspect
-    loc = None
-    frame_stack = inspect.stack()
+    import os
+    import sys
     try:
-        for frame in frame_stack:
-            modname = inspect.getmodule(frame[0]).__name__
-            if not modname.startswith('pyrtl.'):
-                full_filename = frame[0].f_code.co_filename
-                filename = full_filename.split('/')[-1].rstrip('.py')
-                lineno = frame[0].f_lineno
-                loc = (filename, lineno)
+        frame = sys._getframe(1)
+        # reading __name__ from f_globals directly avoids inspect.getmodule,
+        # which pulls each frame's source context through linecache
+        while frame is not None:
+            modname = frame.f_globals.get('__name__', '')
+            if modname != 'pyrtl' and not modname.startswith('pyrtl.'):
                 break
+            frame = frame.f_back
+        if frame is None:
+            return None
+        key = (frame.f_code, frame.f_lasti)
+        loc = _callpoint_cache.get(key)
+        if loc is None:
+            full_filename = frame.f_code.co_filename
+            filename = os.path.splitext(os.path.basename(full_filename))[0]
+            loc = (filename, frame.f_lineno)
+            _callpoint_cache[key] = loc
+        return loc
     except Exception:
-        loc = None
-    finally:
-        del frame_stack
-    return loc
+        return None
 
 
 def working_block(block=None):
@@ -2,8 +2,10 @@
 
 from __future__ import division
 
+import operator
 import six
 import math
+from collections import deque
 
 from .pyrtlexceptions import PyrtlError, PyrtlInternalError
 from .core import LogicNet, working_block
@@ -63,24 +65,53 @@ def mux(index, *mux_ins, **kwargs):
 
     # find the diff between the addressable range and number of inputs given
     index = as_wires(index)
-    short_by = 2**len(index) - len(mux_ins)
+    sel_len = len(index)
+    short_by = (1 << sel_len) - len(mux_ins)
     if short_by > 0:
         if default is not None:  # extend the list to appropriate size
             mux_ins = list(mux_ins)
             extention = [default] * short_by
             mux_ins.extend(extention)
 
-    if 2 ** len(index) != len(mux_ins):
+    if (1 << sel_len) != len(mux_ins):
         raise PyrtlError(
             'Mux select line is %d bits, but selecting from %d inputs. '
-            % (len(index), len(mux_ins)))
+            % (sel_len, len(mux_ins)))
 
-    if len(index) == 1:
-        return select(index, falsecase=mux_ins[0], truecase=mux_ins[1])
-    half = len(mux_ins) // 2
-    return select(index[-1],
-                  falsecase=mux(index[0:-1], *mux_ins[:half]),
-                  truecase=mux(index[0:-1], *mux_ins[half:]))
+    # converting and width-matching all of the inputs once up front lets the
+    # tree-building loop below use _select_fast and skip the per-node
+    # as_wires/match_bitwidth re-entry
+    level = list(match_bitwidth(*(as_wires(m) for m in mux_ins)))
+
+    if isinstance(index, Const):
+        # a constant select means the winner is known at elaboration time, so
+        # the whole mux tree folds down to the selected input (width-matched
+        # above, so the result is as wide as the mux would have been)
+        return level[index.val]
+
+    return _mux_internal(index, level)
+
+
+def _mux_internal(index, ins):
+    """ Tree construction behind mux, with none of its validation.
+
+    Assumes index is a WireVector and ins is a list of 1 << len(index)
+    width-matched WireVectors; all checking is the caller's problem.
+    """
+    # build the binary tree of two-way muxes bottom up, one select bit per
+    # level, rather than recursing down (which would re-slice the select and
+    # re-validate the arguments at every level); pairing adjacent entries off
+    # the front of a deque keeps each level a single O(n) pass
+    queue = deque(ins)
+    for i in range(len(index)):
+        sel_bit = index[i]
+        reduced = deque()
+        while queue:
+            false_case = queue.popleft()
+            true_case = queue.popleft()
+            reduced.append(_select_fast(sel_bit, false_case, true_case))
+        queue = reduced
+    return queue[0]
 
 
 def select(sel, truecase, falsecase):
@@ -100,9 +131,14 @@ def select(sel, truecase, falsecase):
     """
     sel, f, t = (as_wires(w) for w in (sel, falsecase, truecase))
     f, t = match_bitwidth(f, t)
-    outwire = WireVector(bitwidth=len(f))
+    return _select_fast(sel, f, t)
 
-    net = LogicNet(op='x', op_param=None, args=(sel, f, t), dests=(outwire,))
+
+def _select_fast(sel, falsecase, truecase):
+    # internal two-way mux for callers (like mux) that have already converted
+    # the arguments to WireVectors and matched the bitwidths of the two cases
+    outwire = WireVector(bitwidth=len(falsecase))
+    net = LogicNet(op='x', op_param=None, args=(sel, falsecase, truecase), dests=(outwire,))
     working_block().add_net(net)  # this includes sanity check on the mux
     return outwire
 
@@ -128,7 +164,26 @@ def concat(*args):
     if len(args) == 1:
         return as_wires(args[0])
 
+    block = working_block()
     arg_wirevectors = tuple(as_wires(arg) for arg in args)
+
+    # if an argument is itself the result of a prior concat, splice that
+    # concat's arguments in directly rather than chaining through the
+    # intermediate wire (concat-of-concat is common in pipelined designs and
+    # the extra wires just inflate every downstream pass); the intermediate
+    # net is left for dead-logic removal in optimize
+    if any(getattr(wv, '_concat_net', None) is not None for wv in arg_wirevectors):
+        spliced = []
+        for wv in arg_wirevectors:
+            driver = getattr(wv, '_concat_net', None)
+            # the cached net may have been removed by a pass, in which case
+            # the wire can no longer be assumed to be a simple concatenation
+            if driver is not None and driver in block.logic:
+                spliced.extend(driver.args)
+            else:
+                spliced.append(wv)
+        arg_wirevectors = tuple(spliced)
+
     final_width = sum(len(arg) for arg in arg_wirevectors)
     outwire = WireVector(bitwidth=final_width)
     net = LogicNet(
@@ -136,7 +191,8 @@ def concat(*args):
         op_param=None,
         args=arg_wirevectors,
         dests=(outwire,))
-    working_block().add_net(net)
+    outwire._concat_net = net  # remembered so later concats can splice this one
+    block.add_net(net)
     return outwire
 
 
@@ -356,11 +412,59 @@ def match_bitwidth(*args, **opt):
             raise PyrtlError('error, only supported kwarg to match_bitwidth is "signed"')
         signed = bool(opt['signed'])
 
-    max_len = max(len(wv) for wv in args)
+    lengths = [len(wv) for wv in args]
+    max_len = max(lengths)
+    # already-wide-enough wires pass through untouched; matching widths is the
+    # common case (e.g. both operands of every binary op) so skip the extend
+    # call entirely rather than letting it discover there is nothing to do
     if signed:
-        return (wv.sign_extended(max_len) for wv in args)
+        return (wv if wv_len == max_len else wv.sign_extended(max_len)
+                for wv, wv_len in zip(args, lengths))
     else:
-        return (wv.zero_extended(max_len) for wv in args)
+        return (wv if wv_len == max_len else wv.zero_extended(max_len)
+                for wv, wv_len in zip(args, lengths))
+
+
+# _MemIndexed is bound lazily on first use; memory imports this module, so
+# importing it back at load time would create a circular import
+_MemIndexed = None
+
+
+def _resolve_memindexed():
+    global _MemIndexed
+    from .memory import _MemIndexed
+    return _MemIndexed
+
+
+# types as_wires converts to a Const, built once rather than per call
+_const_literal_types = (int,) + tuple(six.string_types)
+
+# bound on the number of memoized Consts kept per block (evicted LRU-first)
+_const_cache_maxsize = 1024
+
+
+def _const_cached(val, bitwidth, block):
+    """ Return a Const for val, reusing an equivalent one already in the block.
+
+    as_wires is called for every literal operand (e.g. the "1" in "x+1") and
+    most designs convert the same handful of small constants over and over, so
+    the (type, value, bitwidth) -> Const mapping is memoized per block.  The
+    type is part of the key since an int and a verilog-style string may map to
+    different constants.
+    """
+    key = (type(val), val, bitwidth)
+    cache = block._const_cache
+    c = cache.get(key)
+    # a cached wire may have been removed from the block by an optimization
+    # pass, in which case it cannot be reused and must be rebuilt
+    if c is not None and c in block.wirevector_set:
+        cache.move_to_end(key)
+        return c
+    c = Const(val, bitwidth=bitwidth, block=block)
+    if len(cache) >= _const_cache_maxsize:
+        cache.popitem(last=False)
+    cache[key] = c
+    return c
 
 
 def as_wires(val, bitwidth=None, truncating=True, block=None):
@@ -386,13 +490,23 @@ def as_wires(val, bitwidth=None, truncating=True, block=None):
     assuming it is a WireVector.
 
     """
-    from .memory import _MemIndexed
+    # the overwhelmingly common inputs are an exact WireVector passed through
+    # unchanged or a small int literal; a type identity check dispatches in
+    # one comparison where isinstance walks the class hierarchy, and subclass
+    # or unusual inputs simply fall through to the general path below
+    val_type = type(val)
+    if val_type is WireVector and bitwidth is None and val.bitwidth is not None:
+        return val
+    if val_type is int or val_type is bool:
+        return _const_cached(val, bitwidth, working_block(block))
+
+    mem_indexed = _MemIndexed or _resolve_memindexed()
     block = working_block(block)
 
-    if isinstance(val, (int, six.string_types)):
+    if isinstance(val, _const_literal_types):
         # note that this case captures bool as well (as bools are instances of ints)
-        return Const(val, bitwidth=bitwidth, block=block)
-    elif isinstance(val, _MemIndexed):
+        return _const_cached(val, bitwidth, block)
+    elif isinstance(val, mem_indexed):
         # convert to a memory read when the value is actually used
         if val.wire is None:
             val.wire = as_wires(val.mem._readaccess(val.index), bitwidth, truncating, block)
@@ -402,11 +516,12 @@ def as_wires(val, bitwidth=None, truncating=True, block=None):
                          'const string got %s instead' % repr(val))
     elif bitwidth == '0':
         raise PyrtlError('error, bitwidth must be >= 1')
-    elif val.bitwidth is None:
+    val_bitwidth = val.bitwidth
+    if val_bitwidth is None:
         raise PyrtlError('error, attempting to use wirevector with no defined bitwidth')
-    elif bitwidth and bitwidth > val.bitwidth:
+    elif bitwidth and bitwidth > val_bitwidth:
         return val.zero_extended(bitwidth)
-    elif bitwidth and truncating and bitwidth < val.bitwidth:
+    elif bitwidth and truncating and bitwidth < val_bitwidth:
         return val[:bitwidth]  # truncate the upper bits
     else:
         return val
@@ -569,7 +684,7 @@ def and_all_bits(vector):
     :return: Returns a 1 bit result, the bitwise `and` of all of
     the bits in the vector to a single bit.
     """
-    return tree_reduce(lambda a, b: a & b, vector)
+    return _apply_op_over_all_bits(operator.and_, vector)
 
 
 def or_all_bits(vector):
@@ -579,7 +694,7 @@ def or_all_bits(vector):
     :return: Returns a 1 bit result, the bitwise `or` of all of
     the bits in the vector to a single bit.
     """
-    return tree_reduce(lambda a, b: a | b, vector)
+    return _apply_op_over_all_bits(operator.or_, vector)
 
 
 def xor_all_bits(vector):
@@ -589,7 +704,7 @@ def xor_all_bits(vector):
     :return: Returns a 1 bit result, the bitwise `xor` of all of
     the bits in the vector to a single bit.
     """
-    return tree_reduce(lambda a, b: a ^ b, vector)
+    return _apply_op_over_all_bits(operator.xor, vector)
 
 
 parity = xor_all_bits  # shadowing the xor_all_bits function
@@ -598,20 +713,21 @@ parity = xor_all_bits  # shadowing the xor_all_bits function
 def tree_reduce(op, vector):
     if len(vector) < 1:
         raise PyrtlError("Cannot reduce empty vectors")
-    if len(vector) == 1:
-        return vector[0]
-    left = tree_reduce(op, vector[:len(vector) // 2])
-    right = tree_reduce(op, vector[len(vector) // 2:])
-    return op(left, right)
-
-
-def _apply_op_over_all_bits(op, vector):
-    if len(vector) < 1:
-        raise PyrtlError("Cannot reduce empty vectors")
-    if len(vector) == 1:
-        return vector[0]
-    rest = _apply_op_over_all_bits(op, vector[1:])
-    return op(vector[0], rest)
+    # index out the elements once up front: slicing a WireVector builds a
+    # select net, so the old recursive halving paid a net per slice on top of
+    # the reduction itself; the pairwise fold below makes the same balanced
+    # (log depth) tree of op nets without any slicing or recursion
+    vals = [vector[i] for i in range(len(vector))]
+    while len(vals) > 1:
+        reduced = [op(a, b) for a, b in zip(vals[0::2], vals[1::2])]
+        if len(vals) % 2:
+            reduced.append(vals[-1])
+        vals = reduced
+    return vals[0]
+
+
+# the private reduction helper converged on the same balanced fold
+_apply_op_over_all_bits = tree_reduce
 
 
 def rtl_any(*vectorlist):
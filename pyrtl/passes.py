@@ -740,9 +740,16 @@ def two_way_concat(net):
     if len(net.args) <= 2:
         return True
 
-    w = concat(net.args[0], net.args[1])
+    def concat2(a, b):
+        # build the 2-way concat net directly; corecircuits.concat would
+        # splice the nested concats right back into a single n-way net
+        out = WireVector(bitwidth=len(a) + len(b))
+        working_block().add_net(LogicNet('c', None, args=(a, b), dests=(out,)))
+        return out
+
+    w = concat2(net.args[0], net.args[1])
     for a in net.args[2:]:
-        w = concat(w, a)
+        w = concat2(w, a)
 
     dest = net.dests[0]
     dest <<= w
@@ -32,6 +32,20 @@ from .core import working_block, LogicNet, _NameIndexer
 _wvIndexer = _NameIndexer("tmp")
 _constIndexer = _NameIndexer("const_")
 
+# corecircuits imports this module, so these are bound lazily on first use
+# rather than re-imported inside every operator call
+_as_wires = None
+_match_bitwidth = None
+_concat = None
+
+
+def _resolve_corecircuits():
+    global _as_wires, _match_bitwidth, _concat
+    from . import corecircuits
+    _as_wires = corecircuits.as_wires
+    _match_bitwidth = corecircuits.match_bitwidth
+    _concat = corecircuits.concat
+
 
 def _reset_wire_indexers():
     global _wvIndexer, _constIndexer
@@ -170,8 +184,9 @@ class WireVector(object):
 
     def _prepare_for_assignment(self, rhs):
         # Convert right-hand-side to wires and propagate bitwidth if necessary
-        from .corecircuits import as_wires
-        rhs = as_wires(rhs, bitwidth=self.bitwidth)
+        if _as_wires is None:
+            _resolve_corecircuits()
+        rhs = _as_wires(rhs, bitwidth=self.bitwidth)
         if self.bitwidth is None:
             self.bitwidth = rhs.bitwidth
         return rhs
@@ -203,11 +218,12 @@ class WireVector(object):
         return self
 
     def _two_var_op(self, other, op):
-        from .corecircuits import as_wires, match_bitwidth
+        if _as_wires is None:
+            _resolve_corecircuits()
 
         # convert constants if necessary
-        a, b = self, as_wires(other)
-        a, b = match_bitwidth(a, b)
+        a, b = self, _as_wires(other)
+        a, b = _match_bitwidth(a, b)
         resultlen = len(a)  # both are the same length now
 
         # some operations actually create more or less bits
@@ -319,8 +335,9 @@ class WireVector(object):
         return self._two_var_op(other, '-')
 
     def __rsub__(self, other):
-        from .corecircuits import as_wires
-        other = as_wires(other)  # '-' op is not symmetric
+        if _as_wires is None:
+            _resolve_corecircuits()
+        other = _as_wires(other)  # '-' op is not symmetric
         return other._two_var_op(self, '-')
 
     def __isub__(self, other):
@@ -534,7 +551,8 @@ class WireVector(object):
                 'Neither zero_extended nor sign_extended can'
                 ' reduce the number of bits')
         else:
-            from .corecircuits import concat
+            if _concat is None:
+                _resolve_corecircuits()
             if isinstance(extbit, int):
                 extbit = Const(extbit, bitwidth=1)
             extvector = WireVector(bitwidth=numext)
@@ -544,7 +562,7 @@ class WireVector(object):
                 args=(extbit,),
                 dests=(extvector,))
             working_block().add_net(net)
-            return concat(extvector, self)
+            return _concat(extvector, self)
 
 
 # -----------------------------------------------------------------------
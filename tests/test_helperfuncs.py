@@ -772,6 +772,69 @@ class TestXorAllBits(unittest.TestCase):
         self.assertEqual(expected, utils.sim_and_ret_out(out, in_wires, vals))
 
 
+class TestAsWiresConstCache(unittest.TestCase):
+    def setUp(self):
+        pyrtl.reset_working_block()
+
+    def test_same_const_reused(self):
+        a = pyrtl.as_wires(3, bitwidth=4)
+        b = pyrtl.as_wires(3, bitwidth=4)
+        self.assertIs(a, b)
+
+    def test_different_bitwidth_not_shared(self):
+        a = pyrtl.as_wires(3, bitwidth=4)
+        b = pyrtl.as_wires(3, bitwidth=5)
+        self.assertIsNot(a, b)
+
+    def test_bool_and_int_not_shared(self):
+        a = pyrtl.as_wires(True)
+        b = pyrtl.as_wires(1)
+        self.assertEqual(a.val, b.val)
+
+    def test_cache_does_not_leak_across_blocks(self):
+        a = pyrtl.as_wires(3, bitwidth=4)
+        pyrtl.reset_working_block()
+        b = pyrtl.as_wires(3, bitwidth=4)
+        self.assertIsNot(a, b)
+
+    def test_cached_const_simulates_correctly(self):
+        i = pyrtl.Input(4, 'i')
+        o = pyrtl.Output(name='o')
+        o <<= (i + 1) * (i + 1)
+        sim_trace = pyrtl.SimulationTrace()
+        sim = pyrtl.Simulation(tracer=sim_trace)
+        for val in range(8):
+            sim.step({'i': val})
+        self.assertEqual(sim_trace.trace['o'], [(v + 1) ** 2 for v in range(8)])
+
+
+class TestConcatFusion(unittest.TestCase):
+    def setUp(self):
+        pyrtl.reset_working_block()
+
+    def test_nested_concat_args_are_spliced(self):
+        a = pyrtl.Input(2, 'a')
+        b = pyrtl.Input(3, 'b')
+        c = pyrtl.Input(4, 'c')
+        inner = pyrtl.corecircuits.concat(a, b)
+        outer = pyrtl.corecircuits.concat(inner, c)
+        self.assertEqual(len(outer), 9)
+        outer_net = next(n for n in pyrtl.working_block().logic_subset(op='c')
+                         if n.dests[0] is outer)
+        self.assertEqual(outer_net.args, (a, b, c))
+
+    def test_fused_concat_simulates_correctly(self):
+        a = pyrtl.Input(2, 'a')
+        b = pyrtl.Input(3, 'b')
+        c = pyrtl.Input(4, 'c')
+        o = pyrtl.Output(9, 'o')
+        o <<= pyrtl.corecircuits.concat(pyrtl.corecircuits.concat(a, b), c)
+        sim_trace = pyrtl.SimulationTrace()
+        sim = pyrtl.Simulation(tracer=sim_trace)
+        sim.step({'a': 2, 'b': 5, 'c': 9})
+        self.assertEqual(sim_trace.trace['o'], [(2 << 7) | (5 << 4) | 9])
+
+
 class TestMux(unittest.TestCase):
     def setUp(self):
         pyrtl.reset_working_block()
@@ -816,6 +879,22 @@ class TestMux(unittest.TestCase):
         with self.assertRaises(pyrtl.PyrtlError):
             r = pyrtl.corecircuits.mux(s, a, b, c, d, e, default=0)
 
+    def test_mux_constant_select_folds_away(self):
+        a = pyrtl.WireVector(name='a', bitwidth=3)
+        b = pyrtl.WireVector(name='b', bitwidth=3)
+        c = pyrtl.WireVector(name='c', bitwidth=3)
+        d = pyrtl.WireVector(name='d', bitwidth=3)
+        r = pyrtl.corecircuits.mux(pyrtl.Const(2, bitwidth=2), a, b, c, d)
+        self.assertIs(r, c)
+        self.assertEqual(len(pyrtl.working_block().logic_subset(op='x')), 0)
+
+    def test_mux_constant_select_still_validated(self):
+        a = pyrtl.WireVector(name='a', bitwidth=3)
+        b = pyrtl.WireVector(name='b', bitwidth=3)
+        c = pyrtl.WireVector(name='c', bitwidth=3)
+        with self.assertRaises(pyrtl.PyrtlError):
+            pyrtl.corecircuits.mux(pyrtl.Const(0, bitwidth=2), a, b, c)
+
     def test_mux_too_many_inputs_with_extra_kwarg(self):
         a = pyrtl.WireVector(name='a', bitwidth=3)
         b = pyrtl.WireVector(name='b', bitwidth=1)
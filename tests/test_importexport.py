@@ -783,114 +783,51 @@ module toplevel(clk, rst, a, o);
     reg[3:0] s;
 
     wire[1:0] const_0_0;
-    wire[1:0] const_1_0;
-    wire const_2_1;
-    wire[1:0] const_3_1;
-    wire const_4_1;
-    wire const_5_0;
-    wire[1:0] const_6_1;
-    wire const_7_1;
-    wire[1:0] const_8_0;
-    wire[1:0] const_9_0;
-    wire const_10_1;
-    wire[1:0] const_11_1;
+    wire const_1_1;
+    wire[1:0] const_2_1;
+    wire const_3_1;
+    wire const_4_0;
+    wire const_5_1;
+    wire const_6_1;
+    wire const_7_0;
+    wire const_8_1;
+    wire const_9_1;
+    wire const_10_0;
+    wire const_11_1;
     wire const_12_1;
     wire const_13_0;
-    wire[1:0] const_14_1;
+    wire const_14_1;
     wire const_15_1;
-    wire[1:0] const_16_0;
-    wire[1:0] const_17_0;
+    wire const_16_0;
+    wire const_17_1;
     wire const_18_1;
-    wire[1:0] const_19_1;
+    wire const_19_0;
     wire const_20_1;
-    wire const_21_0;
-    wire[1:0] const_22_1;
+    wire const_21_1;
+    wire const_22_0;
     wire const_23_1;
-    wire[1:0] const_24_0;
-    wire[1:0] const_25_0;
+    wire const_24_1;
+    wire const_25_0;
     wire const_26_1;
-    wire[1:0] const_27_1;
-    wire const_28_1;
-    wire const_29_0;
-    wire[1:0] const_30_1;
-    wire const_31_1;
-    wire[1:0] const_32_0;
-    wire[1:0] const_33_0;
-    wire const_34_1;
-    wire[1:0] const_35_1;
+    wire const_27_1;
+    wire const_28_0;
+    wire const_29_1;
+    wire const_30_1;
+    wire const_31_0;
+    wire const_32_1;
+    wire const_33_1;
+    wire const_34_0;
+    wire const_35_1;
     wire const_36_1;
     wire const_37_0;
-    wire[1:0] const_38_1;
-    wire const_39_1;
-    wire[1:0] const_40_0;
-    wire[1:0] const_41_0;
+    wire const_38_1;
+    wire const_39_0;
+    wire const_40_0;
+    wire const_41_0;
     wire const_42_1;
-    wire[1:0] const_43_1;
-    wire const_44_1;
+    wire[3:0] const_43_9;
+    wire const_44_0;
     wire const_45_0;
-    wire[1:0] const_46_1;
-    wire const_47_1;
-    wire[1:0] const_48_0;
-    wire[1:0] const_49_0;
-    wire const_50_1;
-    wire[1:0] const_51_1;
-    wire const_52_1;
-    wire const_53_0;
-    wire[1:0] const_54_1;
-    wire const_55_1;
-    wire[1:0] const_56_0;
-    wire[1:0] const_57_0;
-    wire const_58_1;
-    wire[1:0] const_59_1;
-    wire const_60_1;
-    wire const_61_0;
-    wire[1:0] const_62_1;
-    wire const_63_1;
-    wire[1:0] const_64_0;
-    wire[1:0] const_65_0;
-    wire const_66_1;
-    wire[1:0] const_67_1;
-    wire const_68_1;
-    wire const_69_0;
-    wire[1:0] const_70_1;
-    wire const_71_1;
-    wire[1:0] const_72_0;
-    wire[1:0] const_73_0;
-    wire const_74_1;
-    wire[1:0] const_75_1;
-    wire const_76_1;
-    wire const_77_0;
-    wire[1:0] const_78_1;
-    wire const_79_1;
-    wire[1:0] const_80_0;
-    wire[1:0] const_81_0;
-    wire const_82_1;
-    wire[1:0] const_83_1;
-    wire const_84_1;
-    wire const_85_0;
-    wire[1:0] const_86_1;
-    wire const_87_1;
-    wire[1:0] const_88_0;
-    wire[1:0] const_89_0;
-    wire const_90_1;
-    wire[1:0] const_91_1;
-    wire const_92_1;
-    wire const_93_0;
-    wire[1:0] const_94_1;
-    wire const_95_1;
-    wire const_96_1;
-    wire const_97_0;
-    wire const_98_0;
-    wire const_99_1;
-    wire const_100_0;
-    wire[1:0] const_101_0;
-    wire[1:0] const_102_0;
-    wire const_103_1;
-    wire[3:0] const_104_9;
-    wire[1:0] const_105_0;
-    wire const_106_0;
-    wire[1:0] const_107_0;
-    wire const_108_0;
     wire[2:0] tmp12;
     wire[3:0] tmp13;
     wire[4:0] tmp14;
@@ -963,179 +900,116 @@ module toplevel(clk, rst, a, o);
 
     // Combinational
     assign const_0_0 = 0;
-    assign const_1_0 = 0;
+    assign const_1_1 = 1;
     assign const_2_1 = 1;
     assign const_3_1 = 1;
-    assign const_4_1 = 1;
-    assign const_5_0 = 0;
+    assign const_4_0 = 0;
+    assign const_5_1 = 1;
     assign const_6_1 = 1;
-    assign const_7_1 = 1;
-    assign const_8_0 = 0;
-    assign const_9_0 = 0;
-    assign const_10_1 = 1;
+    assign const_7_0 = 0;
+    assign const_8_1 = 1;
+    assign const_9_1 = 1;
+    assign const_10_0 = 0;
     assign const_11_1 = 1;
     assign const_12_1 = 1;
     assign const_13_0 = 0;
     assign const_14_1 = 1;
     assign const_15_1 = 1;
     assign const_16_0 = 0;
-    assign const_17_0 = 0;
+    assign const_17_1 = 1;
     assign const_18_1 = 1;
-    assign const_19_1 = 1;
+    assign const_19_0 = 0;
     assign const_20_1 = 1;
-    assign const_21_0 = 0;
-    assign const_22_1 = 1;
+    assign const_21_1 = 1;
+    assign const_22_0 = 0;
     assign const_23_1 = 1;
-    assign const_24_0 = 0;
+    assign const_24_1 = 1;
     assign const_25_0 = 0;
     assign const_26_1 = 1;
     assign const_27_1 = 1;
-    assign const_28_1 = 1;
-    assign const_29_0 = 0;
+    assign const_28_0 = 0;
+    assign const_29_1 = 1;
     assign const_30_1 = 1;
-    assign const_31_1 = 1;
-    assign const_32_0 = 0;
-    assign const_33_0 = 0;
-    assign const_34_1 = 1;
+    assign const_31_0 = 0;
+    assign const_32_1 = 1;
+    assign const_33_1 = 1;
+    assign const_34_0 = 0;
     assign const_35_1 = 1;
     assign const_36_1 = 1;
     assign const_37_0 = 0;
     assign const_38_1 = 1;
-    assign const_39_1 = 1;
+    assign const_39_0 = 0;
     assign const_40_0 = 0;
     assign const_41_0 = 0;
     assign const_42_1 = 1;
-    assign const_43_1 = 1;
-    assign const_44_1 = 1;
+    assign const_43_9 = 9;
+    assign const_44_0 = 0;
     assign const_45_0 = 0;
-    assign const_46_1 = 1;
-    assign const_47_1 = 1;
-    assign const_48_0 = 0;
-    assign const_49_0 = 0;
-    assign const_50_1 = 1;
-    assign const_51_1 = 1;
-    assign const_52_1 = 1;
-    assign const_53_0 = 0;
-    assign const_54_1 = 1;
-    assign const_55_1 = 1;
-    assign const_56_0 = 0;
-    assign const_57_0 = 0;
-    assign const_58_1 = 1;
-    assign const_59_1 = 1;
-    assign const_60_1 = 1;
-    assign const_61_0 = 0;
-    assign const_62_1 = 1;
-    assign const_63_1 = 1;
-    assign const_64_0 = 0;
-    assign const_65_0 = 0;
-    assign const_66_1 = 1;
-    assign const_67_1 = 1;
-    assign const_68_1 = 1;
-    assign const_69_0 = 0;
-    assign const_70_1 = 1;
-    assign const_71_1 = 1;
-    assign const_72_0 = 0;
-    assign const_73_0 = 0;
-    assign const_74_1 = 1;
-    assign const_75_1 = 1;
-    assign const_76_1 = 1;
-    assign const_77_0 = 0;
-    assign const_78_1 = 1;
-    assign const_79_1 = 1;
-    assign const_80_0 = 0;
-    assign const_81_0 = 0;
-    assign const_82_1 = 1;
-    assign const_83_1 = 1;
-    assign const_84_1 = 1;
-    assign const_85_0 = 0;
-    assign const_86_1 = 1;
-    assign const_87_1 = 1;
-    assign const_88_0 = 0;
-    assign const_89_0 = 0;
-    assign const_90_1 = 1;
-    assign const_91_1 = 1;
-    assign const_92_1 = 1;
-    assign const_93_0 = 0;
-    assign const_94_1 = 1;
-    assign const_95_1 = 1;
-    assign const_96_1 = 1;
-    assign const_97_0 = 0;
-    assign const_98_0 = 0;
-    assign const_99_1 = 1;
-    assign const_100_0 = 0;
-    assign const_101_0 = 0;
-    assign const_102_0 = 0;
-    assign const_103_1 = 1;
-    assign const_104_9 = 9;
-    assign const_105_0 = 0;
-    assign const_106_0 = 0;
-    assign const_107_0 = 0;
-    assign const_108_0 = 0;
     assign o = tmp80;
-    assign tmp12 = {const_5_0, const_5_0, const_5_0};
-    assign tmp13 = {tmp12, const_4_1};
+    assign tmp12 = {const_4_0, const_4_0, const_4_0};
+    assign tmp13 = {tmp12, const_3_1};
     assign tmp14 = r + tmp13;
     assign tmp15 = {tmp14[3], tmp14[2], tmp14[1], tmp14[0]};
-    assign tmp16 = {const_13_0, const_13_0, const_13_0};
-    assign tmp17 = {tmp16, const_12_1};
+    assign tmp16 = {const_7_0, const_7_0, const_7_0};
+    assign tmp17 = {tmp16, const_3_1};
     assign tmp18 = r + tmp17;
     assign tmp19 = {tmp18[3], tmp18[2], tmp18[1], tmp18[0]};
-    assign tmp20 = {const_21_0, const_21_0, const_21_0};
-    assign tmp21 = {tmp20, const_20_1};
+    assign tmp20 = {const_10_0, const_10_0, const_10_0};
+    assign tmp21 = {tmp20, const_3_1};
     assign tmp22 = r + tmp21;
     assign tmp23 = {tmp22[3], tmp22[2], tmp22[1], tmp22[0]};
-    assign tmp24 = {const_29_0, const_29_0, const_29_0};
-    assign tmp25 = {tmp24, const_28_1};
+    assign tmp24 = {const_13_0, const_13_0, const_13_0};
+    assign tmp25 = {tmp24, const_3_1};
     assign tmp26 = r + tmp25;
     assign tmp27 = {tmp26[3], tmp26[2], tmp26[1], tmp26[0]};
-    assign tmp28 = {const_37_0, const_37_0, const_37_0};
-    assign tmp29 = {tmp28, const_36_1};
+    assign tmp28 = {const_16_0, const_16_0, const_16_0};
+    assign tmp29 = {tmp28, const_3_1};
     assign tmp30 = r + tmp29;
     assign tmp31 = {tmp30[3], tmp30[2], tmp30[1], tmp30[0]};
-    assign tmp32 = {const_45_0, const_45_0, const_45_0};
-    assign tmp33 = {tmp32, const_44_1};
+    assign tmp32 = {const_19_0, const_19_0, const_19_0};
+    assign tmp33 = {tmp32, const_3_1};
     assign tmp34 = r + tmp33;
     assign tmp35 = {tmp34[3], tmp34[2], tmp34[1], tmp34[0]};
-    assign tmp36 = {const_53_0, const_53_0, const_53_0};
-    assign tmp37 = {tmp36, const_52_1};
+    assign tmp36 = {const_22_0, const_22_0, const_22_0};
+    assign tmp37 = {tmp36, const_3_1};
     assign tmp38 = r + tmp37;
     assign tmp39 = {tmp38[3], tmp38[2], tmp38[1], tmp38[0]};
-    assign tmp40 = {const_61_0, const_61_0, const_61_0};
-    assign tmp41 = {tmp40, const_60_1};
+    assign tmp40 = {const_25_0, const_25_0, const_25_0};
+    assign tmp41 = {tmp40, const_3_1};
     assign tmp42 = r + tmp41;
     assign tmp43 = {tmp42[3], tmp42[2], tmp42[1], tmp42[0]};
-    assign tmp44 = {const_69_0, const_69_0, const_69_0};
-    assign tmp45 = {tmp44, const_68_1};
+    assign tmp44 = {const_28_0, const_28_0, const_28_0};
+    assign tmp45 = {tmp44, const_3_1};
     assign tmp46 = r + tmp45;
     assign tmp47 = {tmp46[3], tmp46[2], tmp46[1], tmp46[0]};
-    assign tmp48 = {const_77_0, const_77_0, const_77_0};
-    assign tmp49 = {tmp48, const_76_1};
+    assign tmp48 = {const_31_0, const_31_0, const_31_0};
+    assign tmp49 = {tmp48, const_3_1};
     assign tmp50 = r + tmp49;
     assign tmp51 = {tmp50[3], tmp50[2], tmp50[1], tmp50[0]};
-    assign tmp52 = {const_85_0, const_85_0, const_85_0};
-    assign tmp53 = {tmp52, const_84_1};
+    assign tmp52 = {const_34_0, const_34_0, const_34_0};
+    assign tmp53 = {tmp52, const_3_1};
     assign tmp54 = r + tmp53;
     assign tmp55 = {tmp54[3], tmp54[2], tmp54[1], tmp54[0]};
-    assign tmp56 = {const_93_0, const_93_0, const_93_0};
-    assign tmp57 = {tmp56, const_92_1};
+    assign tmp56 = {const_37_0, const_37_0, const_37_0};
+    assign tmp57 = {tmp56, const_3_1};
     assign tmp58 = r + tmp57;
     assign tmp59 = {tmp58[3], tmp58[2], tmp58[1], tmp58[0]};
     assign tmp60 = a + r;
-    assign tmp61 = {const_97_0, const_97_0, const_97_0, const_97_0};
-    assign tmp62 = {tmp61, const_96_1};
+    assign tmp61 = {const_39_0, const_39_0, const_39_0, const_39_0};
+    assign tmp62 = {tmp61, const_3_1};
     assign tmp63 = tmp60 + tmp62;
-    assign tmp64 = {const_98_0, const_98_0};
+    assign tmp64 = {const_40_0, const_40_0};
     assign tmp65 = {tmp64, s};
     assign tmp66 = tmp63 - tmp65;
     assign tmp67 = {tmp66[3], tmp66[2], tmp66[1], tmp66[0]};
-    assign tmp68 = {const_100_0, const_100_0, const_100_0};
-    assign tmp69 = {tmp68, const_99_1};
+    assign tmp68 = {const_41_0, const_41_0, const_41_0};
+    assign tmp69 = {tmp68, const_3_1};
     assign tmp70 = a - tmp69;
     assign tmp71 = {tmp70[3], tmp70[2], tmp70[1], tmp70[0]};
-    assign tmp73 = {const_106_0};
+    assign tmp73 = {const_44_0};
     assign tmp74 = {tmp73, tmp72};
     assign tmp75 = tmp60 + tmp74;
-    assign tmp77 = {const_108_0, const_108_0};
+    assign tmp77 = {const_45_0, const_45_0};
     assign tmp78 = {tmp77, tmp76};
     assign tmp79 = tmp75 + tmp78;
     assign tmp80 = {tmp79[5], tmp79[4], tmp79[3], tmp79[2], tmp79[1], tmp79[0]};
@@ -1156,142 +1030,142 @@ module toplevel(clk, rst, a, o);
     // Memory mem_0: z
     always @(posedge clk)
     begin
-        if (const_103_1) begin
-            mem_0[const_102_0] <= const_104_9;
+        if (const_42_1) begin
+            mem_0[const_0_0] <= const_43_9;
         end
     end
 
     // Memory mem_1: tmp0
     always @(posedge clk)
     begin
-        if (const_2_1) begin
-            mem_1[const_1_0] <= a;
+        if (const_1_1) begin
+            mem_1[const_0_0] <= a;
         end
-        if (const_7_1) begin
-            mem_1[const_6_1] <= tmp15;
+        if (const_5_1) begin
+            mem_1[const_2_1] <= tmp15;
         end
     end
-    assign tmp72 = mem_1[const_105_0];
+    assign tmp72 = mem_1[const_0_0];
 
     // Memory mem_2: tmp1
     always @(posedge clk)
     begin
-        if (const_10_1) begin
-            mem_2[const_9_0] <= a;
+        if (const_6_1) begin
+            mem_2[const_0_0] <= a;
         end
-        if (const_15_1) begin
-            mem_2[const_14_1] <= tmp19;
+        if (const_8_1) begin
+            mem_2[const_2_1] <= tmp19;
         end
     end
-    assign tmp76 = mem_2[const_107_0];
+    assign tmp76 = mem_2[const_0_0];
 
     // Memory mem_3: tmp2
     always @(posedge clk)
     begin
-        if (const_18_1) begin
-            mem_3[const_17_0] <= a;
+        if (const_9_1) begin
+            mem_3[const_0_0] <= a;
         end
-        if (const_23_1) begin
-            mem_3[const_22_1] <= tmp23;
+        if (const_11_1) begin
+            mem_3[const_2_1] <= tmp23;
         end
     end
 
     // Memory mem_4: tmp3
     always @(posedge clk)
     begin
-        if (const_26_1) begin
-            mem_4[const_25_0] <= a;
+        if (const_12_1) begin
+            mem_4[const_0_0] <= a;
         end
-        if (const_31_1) begin
-            mem_4[const_30_1] <= tmp27;
+        if (const_14_1) begin
+            mem_4[const_2_1] <= tmp27;
         end
     end
 
     // Memory mem_5: tmp4
     always @(posedge clk)
     begin
-        if (const_34_1) begin
-            mem_5[const_33_0] <= a;
+        if (const_15_1) begin
+            mem_5[const_0_0] <= a;
         end
-        if (const_39_1) begin
-            mem_5[const_38_1] <= tmp31;
+        if (const_17_1) begin
+            mem_5[const_2_1] <= tmp31;
         end
     end
 
     // Memory mem_6: tmp5
     always @(posedge clk)
     begin
-        if (const_42_1) begin
-            mem_6[const_41_0] <= a;
+        if (const_18_1) begin
+            mem_6[const_0_0] <= a;
         end
-        if (const_47_1) begin
-            mem_6[const_46_1] <= tmp35;
+        if (const_20_1) begin
+            mem_6[const_2_1] <= tmp35;
         end
     end
 
     // Memory mem_7: tmp6
     always @(posedge clk)
     begin
-        if (const_50_1) begin
-            mem_7[const_49_0] <= a;
+        if (const_21_1) begin
+            mem_7[const_0_0] <= a;
         end
-        if (const_55_1) begin
-            mem_7[const_54_1] <= tmp39;
+        if (const_23_1) begin
+            mem_7[const_2_1] <= tmp39;
         end
     end
 
     // Memory mem_8: tmp7
     always @(posedge clk)
     begin
-        if (const_58_1) begin
-            mem_8[const_57_0] <= a;
+        if (const_24_1) begin
+            mem_8[const_0_0] <= a;
         end
-        if (const_63_1) begin
-            mem_8[const_62_1] <= tmp43;
+        if (const_26_1) begin
+            mem_8[const_2_1] <= tmp43;
         end
     end
 
     // Memory mem_9: tmp8
     always @(posedge clk)
     begin
-        if (const_66_1) begin
-            mem_9[const_65_0] <= a;
+        if (const_27_1) begin
+            mem_9[const_0_0] <= a;
         end
-        if (const_71_1) begin
-            mem_9[const_70_1] <= tmp47;
+        if (const_29_1) begin
+            mem_9[const_2_1] <= tmp47;
         end
     end
 
     // Memory mem_10: tmp9
     always @(posedge clk)
     begin
-        if (const_74_1) begin
-            mem_10[const_73_0] <= a;
+        if (const_30_1) begin
+            mem_10[const_0_0] <= a;
         end
-        if (const_79_1) begin
-            mem_10[const_78_1] <= tmp51;
+        if (const_32_1) begin
+            mem_10[const_2_1] <= tmp51;
         end
     end
 
     // Memory mem_11: tmp10
     always @(posedge clk)
     begin
-        if (const_82_1) begin
-            mem_11[const_81_0] <= a;
+        if (const_33_1) begin
+            mem_11[const_0_0] <= a;
         end
-        if (const_87_1) begin
-            mem_11[const_86_1] <= tmp55;
+        if (const_35_1) begin
+            mem_11[const_2_1] <= tmp55;
         end
     end
 
     // Memory mem_12: tmp11
     always @(posedge clk)
     begin
-        if (const_90_1) begin
-            mem_12[const_89_0] <= a;
+        if (const_36_1) begin
+            mem_12[const_0_0] <= a;
         end
-        if (const_95_1) begin
-            mem_12[const_94_1] <= tmp59;
+        if (const_38_1) begin
+            mem_12[const_2_1] <= tmp59;
         end
     end
 